@@ -1,6 +1,10 @@
 import motor.motor_asyncio
+import orjson
 import os
+import zstandard as zstd
+from bson import Binary
 from dotenv import load_dotenv
+from pymongo import WriteConcern
 
 # Load environment variables from .env file
 load_dotenv()
@@ -10,11 +14,41 @@ MONGO_DETAILS = os.environ.get("MONGO_URI")
 if not MONGO_DETAILS:
     raise ValueError("Please set the MONGO_URI environment variable in your .env file.")
 
-# Establish an asynchronous connection to the database
-client = motor.motor_asyncio.AsyncIOMotorClient(MONGO_DETAILS)
+# Establish a single asynchronous client shared by the whole app.
+# minPoolSize keeps a few connections open so requests don't pay for the handshake.
+client = motor.motor_asyncio.AsyncIOMotorClient(MONGO_DETAILS, minPoolSize=5, maxPoolSize=50)
 
 # Get a specific database (it will be created if it doesn't exist)
 database = client.nylas_transcripts_db
 
 # Get a specific collection to store the transcripts
 transcript_collection = database.get_collection("transcripts")
+
+# Same collection for the poller's intermediate status writes ("joining", "recording", ...).
+# These are acknowledged without waiting for a journal sync: they are transient and are
+# superseded by the next state change or the final "ready"/"failed" write, which keep the default.
+status_collection = transcript_collection.with_options(write_concern=WriteConcern(w=1, j=False))
+
+# --- Transcript storage format ---
+# Transcripts are stored as zstd-compressed JSON in "transcript_blob" rather than as an inline
+# BSON array, which keeps documents small on every read. Older documents still carry
+# the array in "transcript_text".
+TRANSCRIPT_ENCODING = "zstd+json"
+_compressor = zstd.ZstdCompressor(level=7)
+_decompressor = zstd.ZstdDecompressor()
+
+
+def encode_transcript(entries) -> dict:
+    """Return the document fields that store a transcript array in compressed form."""
+    return {
+        "transcript_blob": Binary(_compressor.compress(orjson.dumps(entries))),
+        "transcript_encoding": TRANSCRIPT_ENCODING,
+    }
+
+
+def decode_transcript(doc: dict):
+    """Return a document's transcript (array, or legacy transcript_text value), or None if it has none."""
+    blob = doc.get("transcript_blob")
+    if blob is not None and doc.get("transcript_encoding") == TRANSCRIPT_ENCODING:
+        return orjson.loads(_decompressor.decompress(blob))
+    return doc.get("transcript_text")
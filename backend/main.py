@@ -1,14 +1,76 @@
 import asyncio
-import json
-from fastapi import FastAPI, BackgroundTasks, HTTPException
+import hashlib
+import hmac
+import httpx
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+import orjson
+from cachetools import LRUCache
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from time import monotonic
+from urllib.parse import urlparse
+from zoneinfo import ZoneInfo
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, field_validator
 from typing import Optional, List
 from nylas.models.errors import NylasApiError
+from pymongo.errors import PyMongoError
 from nylas.models.notetakers import InviteNotetakerRequest
-from nylas_client import client, NYLAS_GRANT_ID
-from tasks import check_and_get_transcript, transcripts
-from database import transcript_collection
+from nylas_client import client, call_nylas, start_nylas_executor, stop_nylas_executor, NYLAS_GRANT_ID, NYLAS_WEBHOOK_SECRET
+from tasks import check_and_get_transcript, notify_notetaker_update, transcripts
+from database import decode_transcript, transcript_collection
+
+log = logging.getLogger("notetaker")
+
+# Indian Standard Time, used for all user-facing dates
+IST = ZoneInfo("Asia/Kolkata")
+
+# Status -> (message, display_status) shown to the UI for each tracking status
+_STATUS_META = {
+    "scheduled": ("⏰ Meeting hasn't started yet. The bot will automatically join at the scheduled time.", "Scheduled"),
+    "joining": ("🚪 Bot is joining the meeting...", "Joining"),
+    "recording": ("👥 Attending - Bot is in the meeting, recording and transcribing.", "Attending"),
+    "processing": ("⚙️ Processing - Meeting ended. Generating transcript...", "Processing"),
+    "ready": ("📄 Media Available - Transcript is ready!", "Media Available"),
+    "failed": ("❌ Transcription failed.", "Failed"),
+    "timeout": ("⏱️ Transcription timed out.", "Timeout"),
+}
+_NO_STATUS_META = (None, None)
+
+# Cached /transcripts responses: notetaker_id -> (cached_at, response), for the most recent ones.
+# Terminal statuses never change, so those entries are served until evicted or the recording is deleted.
+_RESP_CACHE = LRUCache(maxsize=256)
+_RESP_CACHE_TTL = 3  # seconds, for in-progress statuses
+_TERMINAL = {"ready", "failed", "timeout"}
+
+# Running transcript pollers by notetaker_id; holding a reference keeps them from being
+# garbage collected, and lets the delete endpoints cancel them
+_BG_TASKS: dict[str, asyncio.Task] = {}
+
+# Documents per MongoDB batch when streaming /recordings
+_RECORDINGS_BATCH = 500
+
+# Only the fields the endpoints actually return, so large documents aren't fetched in full
+_RECORDING_FIELDS = {"_id": 1, "status": 1, "transcript_text": 1, "transcript_blob": 1, "transcript_encoding": 1}
+
+# Meeting host (or parent domain) -> Nylas conferencing provider name
+_HOST_PROVIDER = {
+    "meet.google.com": "Google Meet",
+    "zoom.us": "Zoom Meeting",  # Nylas requires exact name "Zoom Meeting"
+    "teams.microsoft.com": "Microsoft Teams",
+    "teams.live.com": "Microsoft Teams",
+    "skype.com": "Skype for Consumer",
+}
+
+# "https://", "zoommtg://", ... at the start of a URL
+_SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.-]*://", re.IGNORECASE)
 
 def detect_conferencing_provider(meeting_url: str) -> str:
     """
@@ -31,26 +93,112 @@ def detect_conferencing_provider(meeting_url: str) -> str:
     if not meeting_url:
         raise ValueError("Meeting URL is required")
     
-    url_lower = meeting_url.lower()
+    # Parse once; tolerate links pasted without a scheme (e.g. "meet.google.com/abc")
+    parsed = urlparse(meeting_url if _SCHEME_RE.match(meeting_url) else "//" + meeting_url)
+    host = (parsed.hostname or "").lower()
+    path = parsed.path.lower()
     
-    if "meet.google.com" in url_lower:
-        return "Google Meet"
-    elif "zoom.us" in url_lower:
-        if "/wc/" in url_lower or "/j/" not in url_lower:
+    provider = None
+    for domain, name in _HOST_PROVIDER.items():
+        if host == domain or host.endswith("." + domain):
+            provider = name
+            break
+    
+    if provider == "Zoom Meeting":
+        if "/wc/" in path or "/j/" not in path:
             raise ValueError("Invalid Zoom meeting link. Please use a standard Zoom meeting link (e.g., https://zoom.us/j/123456789?pwd=...) instead of personal room or web client links.")
-        return "Zoom Meeting"  # Nylas requires exact name "Zoom Meeting"
-    elif "teams.microsoft.com" in url_lower or "teams.live.com" in url_lower:
-        return "Microsoft Teams"
-    elif "skype.com" in url_lower:
-        if "business" in url_lower:
+    elif provider == "Skype for Consumer":
+        if "business" in host or "business" in path:
             return "Skype for Business"
-        else:
-            return "Skype for Consumer"
-    else:
+    elif provider is None:
         # For unknown providers, use Google Meet as fallback
         return "Google Meet"
+    return provider
+
+_NOT_FOUND_RE = re.compile(r"not found|404", re.IGNORECASE)
+
+
+def _is_not_found(error: NylasApiError) -> bool:
+    """Whether a Nylas error means the resource doesn't exist (checks status_code before the message)."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is not None:
+        return status_code == 404
+    return _NOT_FOUND_RE.search(str(error)) is not None
+
+
+def _start_transcript_task(notetaker_id: str) -> None:
+    """Start polling for the transcript in the background, independent of the request."""
+    task = asyncio.create_task(check_and_get_transcript(notetaker_id, app.state.http))
+    _BG_TASKS[notetaker_id] = task
+
+    def _forget(done: asyncio.Task) -> None:
+        if _BG_TASKS.get(notetaker_id) is done:
+            del _BG_TASKS[notetaker_id]
+
+    task.add_done_callback(_forget)
+
+
+def _cancel_transcript_task(notetaker_id: str) -> None:
+    """Stop polling for a notetaker whose tracking document was deleted."""
+    task = _BG_TASKS.pop(notetaker_id, None)
+    if task is not None:
+        task.cancel()
+        log.info("🛑 Stopped monitoring notetaker %s", notetaker_id)
 
-app = FastAPI()
+
+async def _delete_event_recordings(event_id: str) -> int:
+    """Delete the tracking documents for a calendar event and stop their pollers. Returns the deleted count."""
+    # The IDs are only used to stop pollers and evict caches; the delete itself matches on
+    # event_id, so a document inserted after the lookup is still removed
+    notetaker_ids = [doc["_id"] async for doc in transcript_collection.find({"event_id": event_id}, {"_id": 1})]
+    result = await transcript_collection.delete_many({"event_id": event_id})
+    for notetaker_id in notetaker_ids:
+        _cancel_transcript_task(notetaker_id)
+        _RESP_CACHE.pop(notetaker_id, None)
+        transcripts.pop(notetaker_id, None)
+    return result.deleted_count
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ist(ts: int) -> str:
+    """Format a Unix timestamp as an IST display string (meeting times repeat a lot, so cache)."""
+    return f"{datetime.fromtimestamp(ts, tz=IST):%Y-%m-%d %I:%M %p} IST"
+
+
+def _format_transcript(data):
+    """
+    Format a stored transcript as "Speaker: text" paragraphs.
+
+    Args:
+        data: The stored transcript from MongoDB (JSON array, JSON string or plain text)
+
+    Returns:
+        The formatted transcript, or the original value if it is not a transcript array
+    """
+    if isinstance(data, str):
+        # Try to parse string as JSON if it looks like an array
+        try:
+            parsed = orjson.loads(data)
+        except (orjson.JSONDecodeError, AttributeError):
+            # Not JSON, return as plain text
+            return data
+        if not isinstance(parsed, list):
+            return data
+        data = parsed
+    elif not isinstance(data, list):
+        return data
+
+    parts = []
+    append = parts.append
+    for item in data:
+        if isinstance(item, dict):
+            spk = item.get
+            text = spk("text", "")
+            if text:
+                append(f"{spk('speaker', 'Speaker')}: {text}")
+    return "\n\n".join(parts)
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -62,6 +210,86 @@ app.add_middleware(
 )
 
 
+# Shutdown hooks run in registration order, so this one is registered first: pollers must stop
+# before the log writer, HTTP client and Nylas pool they use are closed.
+@app.on_event("shutdown")
+async def cancel_transcript_tasks():
+    """Cancel the background transcript pollers and wait for them to finish."""
+    tasks = list(_BG_TASKS.values())
+    _BG_TASKS.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+@app.on_event("startup")
+async def configure_logging():
+    """Route log records through a queue so request handlers never block on stderr."""
+    global _log_listener, _log_handler
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    _log_listener.start()
+    _log_handler = logging.handlers.QueueHandler(log_queue)
+    log.addHandler(_log_handler)
+    # INFO by default; set LOG_LEVEL=DEBUG in development for per-entry transcript logs
+    log.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+    log.propagate = False
+
+
+@app.on_event("shutdown")
+async def stop_logging():
+    """Detach the queue handler, then flush and stop the background log writer."""
+    global _log_listener, _log_handler
+    if _log_handler:
+        log.removeHandler(_log_handler)
+        _log_handler = None
+    if _log_listener:
+        _log_listener.stop()
+        _log_listener = None
+
+
+@app.on_event("startup")
+async def open_http_client():
+    """Create the shared HTTP client used to download transcript files (reuses TLS connections)."""
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=60,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
+
+@app.on_event("shutdown")
+async def close_http_client():
+    """Close the shared HTTP client and its connection pool."""
+    await app.state.http.aclose()
+
+
+@app.on_event("startup")
+async def open_nylas_executor():
+    """Start the thread pool used for blocking Nylas SDK calls."""
+    start_nylas_executor()
+
+
+@app.on_event("shutdown")
+async def close_nylas_executor():
+    """Stop the thread pool used for blocking Nylas SDK calls."""
+    stop_nylas_executor()
+
+
+@app.on_event("startup")
+async def init_database():
+    """Warm up the MongoDB connection pool and create the indexes used by the recording and event queries."""
+    await transcript_collection.database.command("ping")
+    # Serves /recordings?status=... filtered and paged by _id without an in-memory sort
+    await transcript_collection.create_index([("status", 1), ("_id", 1)])
+    # delete_calendar_event removes tracking documents by event_id
+    await transcript_collection.create_index("event_id")
+
+
 class Participant(BaseModel):
     email: str
     name: Optional[str] = None
@@ -70,7 +298,17 @@ class Participant(BaseModel):
 class ScheduleMeetingRequest(BaseModel):
     title: str
     meeting_link: str  # Google Meet, Zoom, or Microsoft Teams URL
-    start_time: str  # Format: "2025-10-07 10:46 AM" or "2025-10-07 10:46 PM" (IST)
+    start_time: datetime  # Format: "2025-10-07 10:46 AM" or "2025-10-07 10:46 PM" (IST)
+
+    @field_validator("start_time", mode="before")
+    @classmethod
+    def parse_ist_start_time(cls, value):
+        """Parse "YYYY-MM-DD HH:MM AM/PM" strings as IST; anything else becomes a 422."""
+        # Only strings are accepted: pydantic would otherwise read numbers as UTC timestamps
+        try:
+            return datetime.strptime(value, "%Y-%m-%d %I:%M %p").replace(tzinfo=IST)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid date/time format. Use format: 'YYYY-MM-DD HH:MM AM/PM' (e.g., '2025-10-07 10:46 AM')")
 
 
 @app.get("/transcripts/{notetaker_id}")
@@ -79,82 +317,43 @@ async def get_transcript_status(notetaker_id: str):
     Checks the status of a transcription from MongoDB using the notetaker_id.
     Returns the transcript text and status with detailed information.
     """
+    cached = _RESP_CACHE.get(notetaker_id)
+    if cached:
+        cached_at, cached_response = cached
+        if cached_response["status"] in _TERMINAL or monotonic() - cached_at < _RESP_CACHE_TTL:
+            return cached_response
+    
     # First check MongoDB
-    transcript_data = await transcript_collection.find_one({"_id": notetaker_id})
+    transcript_data = await transcript_collection.find_one({"_id": notetaker_id}, _RECORDING_FIELDS)
 
     if transcript_data:
+        status = transcript_data["status"]
+        # Helpful status message and display status for the UI
+        message, display_status = _STATUS_META.get(status, _NO_STATUS_META)
+        # Extract text with speaker names from the stored transcript JSON array
+        transcript_text = decode_transcript(transcript_data)
+        
         response_data = {
             "notetaker_id": transcript_data["_id"],
-            "status": transcript_data["status"],
+            "status": status,
+            "message": message,
+            "display_status": display_status,
+            "transcript_text": _format_transcript(transcript_text) if transcript_text else None,
         }
         
-        # Extract text with speaker names from transcript_text JSON array
-        if transcript_data.get("transcript_text"):
-            transcript_json = transcript_data["transcript_text"]
-            # Format text with speaker names: "Speaker: text"
-            if isinstance(transcript_json, list):
-                text_parts = []
-                for item in transcript_json:
-                    if isinstance(item, dict):
-                        speaker = item.get("speaker", "Speaker")
-                        text = item.get("text", "")
-                        if text:
-                            text_parts.append(f"{speaker}: {text}")
-                response_data["transcript_text"] = "\n\n".join(text_parts)
-            elif isinstance(transcript_json, str):
-                # Try to parse string as JSON if it looks like an array
-                try:
-                    parsed = json.loads(transcript_json)
-                    if isinstance(parsed, list):
-                        text_parts = []
-                        for item in parsed:
-                            if isinstance(item, dict):
-                                speaker = item.get("speaker", "Speaker")
-                                text = item.get("text", "")
-                                if text:
-                                    text_parts.append(f"{speaker}: {text}")
-                        response_data["transcript_text"] = "\n\n".join(text_parts)
-                    else:
-                        response_data["transcript_text"] = transcript_json
-                except (json.JSONDecodeError, AttributeError):
-                    # Not JSON, return as plain text
-                    response_data["transcript_text"] = transcript_json
-        
-        # Add helpful status messages and display status
-        status = transcript_data["status"]
-        if status == "scheduled":
-            response_data["message"] = "⏰ Meeting hasn't started yet. The bot will automatically join at the scheduled time."
-            response_data["display_status"] = "Scheduled"
-        elif status == "joining":
-            response_data["message"] = "🚪 Bot is joining the meeting..."
-            response_data["display_status"] = "Joining"
-        elif status == "recording":
-            response_data["message"] = "👥 Attending - Bot is in the meeting, recording and transcribing."
-            response_data["display_status"] = "Attending"
-        elif status == "processing":
-            response_data["message"] = "⚙️ Processing - Meeting ended. Generating transcript..."
-            response_data["display_status"] = "Processing"
-        elif status == "ready":
-            response_data["message"] = "📄 Media Available - Transcript is ready!"
-            response_data["display_status"] = "Media Available"
-        elif status == "failed":
-            response_data["message"] = "❌ Transcription failed."
-            response_data["display_status"] = "Failed"
-        elif status == "timeout":
-            response_data["message"] = "⏱️ Transcription timed out."
-            response_data["display_status"] = "Timeout"
-            
+        _RESP_CACHE[notetaker_id] = (monotonic(), response_data)
         return response_data
     
     # Fallback: check in-memory store
     transcript_text = transcripts.get(notetaker_id)
     if transcript_text:
+        message, display_status = _STATUS_META["ready"]
         return {
             "notetaker_id": notetaker_id,
             "status": "ready",
-            "display_status": "Media Available",
+            "message": message,
+            "display_status": display_status,
             "transcript_text": transcript_text,
-            "message": "📄 Media Available - Transcript is ready!"
         }
     
     # If not found anywhere
@@ -164,78 +363,89 @@ async def get_transcript_status(notetaker_id: str):
 
 
 @app.get("/recordings")
-async def get_all_recordings():
+async def get_all_recordings(
+    status: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    after_id: Optional[str] = None,
+):
     """
-    Returns all transcription recordings from MongoDB.
+    Returns transcription recordings from MongoDB (ordered by notetaker ID when paging).
     Only returns: notetaker_id, status, transcript_text
     All data comes directly from database - no external API calls.
+    
+    Args:
+        status: Optional status to filter by (e.g. "ready")
+        limit: Maximum number of recordings to return (1-1000; all recordings if omitted)
+        after_id: Return only recordings after this notetaker ID (pass the last ID of the previous page)
     """
+    query = {}
+    if status:
+        query["status"] = status
+    if after_id:
+        query["_id"] = {"$gt": after_id}
+    
     try:
-        # Get all documents from MongoDB
-        cursor = transcript_collection.find({})
-        recordings = []
-        
+        # Get the documents from MongoDB, in larger batches to cut getMore round-trips
+        cursor = transcript_collection.find(query, _RECORDING_FIELDS, batch_size=_RECORDINGS_BATCH)
+        if limit or after_id:
+            # Keyset pagination needs a stable order
+            cursor = cursor.sort("_id", 1)
+        if limit:
+            cursor = cursor.limit(limit)
+        # The cursor is lazy: read the first batch now, so a database error is still
+        # reported as a 500 instead of a truncated 200 stream
+        first_batch = await cursor.to_list(length=_RECORDINGS_BATCH)
+    except PyMongoError:
+        log.exception("Fetching recordings failed")
+        raise HTTPException(
+            status_code=500,
+            detail="Error fetching recordings from the database."
+        )
+
+    async def _documents():
+        for doc in first_batch:
+            yield doc
         async for doc in cursor:
-            status = doc.get("status", "unknown")
-            recording = {
-                "notetaker_id": doc["_id"],
-                "status": status,
-            }
+            yield doc
+
+    async def _stream():
+        # Serialize one recording at a time so memory stays O(one document)
+        yield b'{"recordings":['
+        # Bind hot-loop globals and methods to locals (LOAD_FAST instead of LOAD_GLOBAL/LOAD_ATTR)
+        dumps = orjson.dumps
+        format_transcript = _format_transcript
+        status_meta = _STATUS_META.get
+        decode = decode_transcript
+        total = 0
+        try:
+            async for doc in _documents():
+                get = doc.get
+                status = get("status", "unknown")
+                recording = {
+                    "notetaker_id": doc["_id"],
+                    "status": status,
+                }
             
-            # Add display status for better UI
-            if status == "recording":
-                recording["display_status"] = "Attending"
-            elif status == "processing":
-                recording["display_status"] = "Processing"
-            elif status == "ready":
-                recording["display_status"] = "Media Available"
-            else:
-                recording["display_status"] = status.title()
+                # Add display status for better UI
+                meta = status_meta(status)
+                recording["display_status"] = meta[1] if meta else status.title()
             
-            # Extract text with speaker names from transcript_text JSON array
-            if doc.get("transcript_text"):
-                transcript_data = doc["transcript_text"]
-                # Format text with speaker names: "Speaker: text"
-                if isinstance(transcript_data, list):
-                    text_parts = []
-                    for item in transcript_data:
-                        if isinstance(item, dict):
-                            speaker = item.get("speaker", "Speaker")
-                            text = item.get("text", "")
-                            if text:
-                                text_parts.append(f"{speaker}: {text}")
-                    recording["transcript_text"] = "\n\n".join(text_parts)
-                elif isinstance(transcript_data, str):
-                    # Try to parse string as JSON if it looks like an array
-                    try:
-                        parsed = json.loads(transcript_data)
-                        if isinstance(parsed, list):
-                            text_parts = []
-                            for item in parsed:
-                                if isinstance(item, dict):
-                                    speaker = item.get("speaker", "Speaker")
-                                    text = item.get("text", "")
-                                    if text:
-                                        text_parts.append(f"{speaker}: {text}")
-                            recording["transcript_text"] = "\n\n".join(text_parts)
-                        else:
-                            recording["transcript_text"] = transcript_data
-                    except (json.JSONDecodeError, AttributeError):
-                        # Not JSON, return as plain text
-                        recording["transcript_text"] = transcript_data
+                # Extract text with speaker names from the stored transcript JSON array
+                transcript_data = decode(doc)
+                if transcript_data:
+                    recording["transcript_text"] = format_transcript(transcript_data)
             
-            recordings.append(recording)
+                yield (b"," if total else b"") + dumps(recording)
+                total += 1
+        except PyMongoError:
+            # Headers are already sent: log and abort the stream so the client sees a failed
+            # (truncated) response rather than a partial list that looks complete
+            log.exception("Fetching recordings failed after %s recordings", total)
+            raise
         
-        return {
-            "total": len(recordings),
-            "recordings": recordings
-        }
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error fetching recordings: {str(e)}"
-        )
+        yield b'],"total":' + str(total).encode() + b"}"
+
+    return StreamingResponse(_stream(), media_type="application/json")
 
 
 @app.delete("/recordings/{notetaker_id}")
@@ -257,47 +467,128 @@ async def delete_recording(notetaker_id: str):
     Note: This action cannot be undone!
     """
     try:
-        # Check if recording exists
-        recording = await transcript_collection.find_one({"_id": notetaker_id})
+        # Delete the recording; deleted_count tells us whether it existed
+        result = await transcript_collection.delete_one({"_id": notetaker_id})
         
-        if not recording:
+        if result.deleted_count == 0:
             raise HTTPException(
                 status_code=404,
                 detail=f"Recording with notetaker ID '{notetaker_id}' not found."
             )
         
-        # Delete the recording
-        result = await transcript_collection.delete_one({"_id": notetaker_id})
+        # Stop its poller, and remove from in-memory store and response cache if exists
+        _cancel_transcript_task(notetaker_id)
+        _RESP_CACHE.pop(notetaker_id, None)
+        if notetaker_id in transcripts:
+            del transcripts[notetaker_id]
         
-        if result.deleted_count > 0:
-            # Also remove from in-memory store if exists
-            if notetaker_id in transcripts:
-                del transcripts[notetaker_id]
-            
-            return {
-                "success": True,
-                "message": f"Recording '{notetaker_id}' deleted successfully.",
-                "deleted_notetaker_id": notetaker_id
-            }
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to delete recording from database."
-            )
+        return {
+            "success": True,
+            "message": f"Recording '{notetaker_id}' deleted successfully.",
+            "deleted_notetaker_id": notetaker_id
+        }
     
-    except HTTPException:
-        raise
-    except Exception as e:
+    except PyMongoError:
+        log.exception("Deleting recording %s failed", notetaker_id)
         raise HTTPException(
             status_code=500,
-            detail=f"Error deleting recording: {str(e)}"
+            detail="Error deleting recording from the database."
         )
 
 
+# --- NYLAS NOTETAKER WEBHOOK ---
+
+@app.get("/webhooks/notetaker")
+async def verify_notetaker_webhook(challenge: str):
+    """
+    Answer the verification challenge Nylas sends when the webhook is registered.
+    """
+    return PlainTextResponse(challenge)
+
+
+@app.post("/webhooks/notetaker")
+async def notetaker_webhook(request: Request):
+    """
+    🔔 NOTETAKER WEBHOOK: Receives Nylas notetaker state-change notifications.
+    
+    Wakes the background task tracking the notetaker so it checks the new state
+    right away instead of waiting for its next poll. The task always re-reads the
+    state from Nylas, so the payload itself is only used to find the notetaker ID.
+    
+    Register this URL in the Nylas dashboard for the notetaker.* triggers.
+    """
+    body = await request.body()
+    if NYLAS_WEBHOOK_SECRET:
+        expected = hmac.new(NYLAS_WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, request.headers.get("x-nylas-signature", "")):
+            raise HTTPException(status_code=401, detail="Invalid webhook signature.")
+    
+    try:
+        notetaker_id = orjson.loads(body)["data"]["object"]["id"]
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Unrecognized notetaker webhook payload.")
+    
+    return {
+        "received": True,
+        "notetaker_id": notetaker_id,
+        "tracked": notify_notetaker_update(notetaker_id)
+    }
+
+
 # --- CREATE MEETING WITH NOTETAKER ENDPOINT ---
 
+def _build_schedule_response(
+    request: ScheduleMeetingRequest,
+    start_dt: datetime,
+    event_id: Optional[str],
+    provider: Optional[str],
+    calendar_link: Optional[str],
+    notetaker_id: Optional[str],
+    bot_error: Optional[str],
+) -> dict:
+    """
+    Build the /schedule-meeting success payload.
+    
+    Each user-facing string picks one precomputed branch instead of evaluating
+    nested conditional f-strings inline.
+    """
+    if not provider:
+        provider_text = " with conferencing link"
+    elif "fallback" in provider:
+        provider_text = f" with {provider}"
+    else:
+        provider_text = f" with {provider} as conferencing provider"
+    
+    if notetaker_id:
+        bot_status = "Configured to join at scheduled time"
+        bot_step = "✅ Bot will automatically join the meeting at the scheduled time"
+        transcript_step = f"✅ After the meeting, use Notetaker ID '{notetaker_id}' to check the transcript"
+    else:
+        bot_status = f"Failed to configure bot: {bot_error}" if bot_error else "Failed to configure bot"
+        bot_step = f"❌ Bot failed to configure: {bot_error}" if bot_error else "❌ Bot failed to configure"
+        transcript_step = "❌ No transcript will be available due to bot failure"
+    
+    return {
+        "success": True,
+        "message": f"✅ Meeting scheduled successfully{provider_text}! Event added to Google Calendar and bot configured to join automatically.",
+        "event_id": event_id,
+        "title": request.title,
+        "start_time": f"{start_dt:%Y-%m-%d %I:%M %p} IST",
+        "meeting_link": request.meeting_link,
+        "provider": provider.replace(" (fallback)", "") if provider else "Generic",
+        "calendar_link": calendar_link,
+        "notetaker_id": notetaker_id,
+        "bot_status": bot_status,
+        "next_steps": [
+            "✅ Event has been added to your Google Calendar",
+            bot_step,
+            transcript_step,
+        ]
+    }
+
+
 @app.post("/schedule-meeting")
-async def schedule_meeting(request: ScheduleMeetingRequest, background_tasks: BackgroundTasks):
+async def schedule_meeting(request: ScheduleMeetingRequest):
     """
     📅 SCHEDULE MEETING: Creates a calendar event in Google Calendar and schedules bot to join.
     
@@ -327,32 +618,14 @@ async def schedule_meeting(request: ScheduleMeetingRequest, background_tasks: Ba
         raise HTTPException(status_code=500, detail="Nylas client not initialized.")
     
     try:
-        from datetime import datetime
-        import pytz
+        # start_time is already parsed into an IST-aware datetime by the request model
+        start_dt = request.start_time
+        start_timestamp = int(start_dt.timestamp())
         
-        # Parse the Indian Standard Time (IST) datetime strings
-        # Supported formats: "2025-10-07 10:46 AM" or "2025-10-07 10:46 PM"
-        try:
-            from datetime import timedelta
-            
-            # Set the timezone to IST (Asia/Kolkata)
-            ist_tz = pytz.timezone("Asia/Kolkata")
-            
-            # Parse start time
-            start_dt = datetime.strptime(request.start_time, "%Y-%m-%d %I:%M %p")
-            start_dt = ist_tz.localize(start_dt)
-            start_timestamp = int(start_dt.timestamp())
-            
-            # Nylas API requires end time when using Notetaker
-            # Default to 1 hour meeting duration
-            end_dt = start_dt + timedelta(hours=1)
-            end_timestamp = int(end_dt.timestamp())
-            
-        except ValueError as e:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid date/time format. Use format: 'YYYY-MM-DD HH:MM AM/PM' (e.g., '2025-10-07 10:46 AM'). Error: {str(e)}"
-            )
+        # Nylas API requires end time when using Notetaker
+        # Default to 1 hour meeting duration
+        end_dt = start_dt + timedelta(hours=1)
+        end_timestamp = int(end_dt.timestamp())
         
         # Create the event with all details including notetaker configuration
         # Using timespan format (required for Notetaker)
@@ -406,19 +679,20 @@ async def schedule_meeting(request: ScheduleMeetingRequest, background_tasks: Ba
         
         # Create the event in the calendar
         provider_display = provider if provider else "generic conferencing link"
-        print(f"🔄 Creating calendar event with provider: {provider_display}")
+        log.info("🔄 Creating calendar event with provider: %s", provider_display)
         try:
-            event_response = client.events.create(
+            event_response = await call_nylas(
+                client.events.create,
                 identifier=NYLAS_GRANT_ID,
                 request_body=event_request,
                 query_params={"calendar_id": "primary"}
             )
-            print(f"✅ Event created successfully with provider: {provider_display}")
+            log.info("✅ Event created successfully with provider: %s", provider_display)
         except Exception as api_error:
-            print(f"❌ Nylas API error with provider '{provider_display}': {str(api_error)}")
+            log.error("❌ Nylas API error with provider '%s': %s", provider_display, api_error)
             # If the provider is not supported, try with Google Meet as fallback
             if provider and ("provider" in str(api_error).lower() or "conferencing" in str(api_error).lower()):
-                print(f"🔄 Retrying with Google Meet as fallback provider...")
+                log.info("🔄 Retrying with Google Meet as fallback provider...")
                 event_request["conferencing"] = {
                     "provider": "Google Meet",
                     "details": {
@@ -429,28 +703,30 @@ async def schedule_meeting(request: ScheduleMeetingRequest, background_tasks: Ba
                 if "location" in event_request:
                     del event_request["location"]
                     
-                event_response = client.events.create(
+                event_response = await call_nylas(
+                    client.events.create,
                     identifier=NYLAS_GRANT_ID,
                     request_body=event_request,
                     query_params={"calendar_id": "primary"}
                 )
                 provider = "Google Meet (fallback)"
-                print(f"✅ Event created with fallback provider: {provider}")
+                log.info("✅ Event created with fallback provider: %s", provider)
             else:
                 raise api_error
         
         event_data = event_response.data
         
         # Extract event ID
-        event_id = event_data.id if hasattr(event_data, 'id') else None
+        event_id = getattr(event_data, "id", None)
         
         # Extract notetaker_id if available
         notetaker_id = None
-        if hasattr(event_data, 'notetaker') and event_data.notetaker:
-            if hasattr(event_data.notetaker, 'id'):
-                notetaker_id = event_data.notetaker.id
-            elif isinstance(event_data.notetaker, dict):
-                notetaker_id = event_data.notetaker.get('id')
+        notetaker = getattr(event_data, "notetaker", None)
+        if notetaker:
+            if isinstance(notetaker, dict):
+                notetaker_id = notetaker.get('id')
+            else:
+                notetaker_id = getattr(notetaker, "id", None)
         
         # Deploy notetaker bot
         # For Zoom: always use direct invitation (more reliable)
@@ -458,7 +734,7 @@ async def schedule_meeting(request: ScheduleMeetingRequest, background_tasks: Ba
         bot_error = None
         if not notetaker_id or is_zoom:
             deployment_reason = "Zoom requires direct invitation" if is_zoom else "Notetaker not auto-created"
-            print(f"⚠️ {deployment_reason}, deploying bot via invite method...")
+            log.warning("⚠️ %s, deploying bot via invite method...", deployment_reason)
             try:
                 request_body: InviteNotetakerRequest = {
                     "meeting_link": request.meeting_link,
@@ -471,66 +747,59 @@ async def schedule_meeting(request: ScheduleMeetingRequest, background_tasks: Ba
                     },
                 }
                 
-                print(f"📞 Inviting bot to {provider} meeting: {request.meeting_link}")
-                notetaker_response = client.notetakers.invite(
+                log.info("📞 Inviting bot to %s meeting: %s", provider, request.meeting_link)
+                notetaker_response = await call_nylas(
+                    client.notetakers.invite,
                     identifier=NYLAS_GRANT_ID,
                     request_body=request_body
                 )
                 
                 notetaker_id = notetaker_response.data.id
-                print(f"✅ Bot successfully deployed to {provider} meeting with ID: {notetaker_id}")
+                log.info("✅ Bot successfully deployed to %s meeting with ID: %s", provider, notetaker_id)
             except Exception as e:
                 bot_error = str(e)
                 error_msg = str(e)
-                print(f"❌ Failed to deploy bot to {provider} meeting: {error_msg}")
+                log.error("❌ Failed to deploy bot to %s meeting: %s", provider, error_msg)
                 
                 # Provide specific guidance for common Zoom errors
                 if is_zoom:
                     if "invalid" in error_msg.lower() or "url" in error_msg.lower():
-                        print(f"💡 Zoom URL may be invalid or expired. Please check:")
-                        print(f"   - URL format: https://zoom.us/j/... or https://us05web.zoom.us/j/...")
-                        print(f"   - Meeting is not expired or cancelled")
-                        print(f"   - Meeting allows participants to join")
+                        log.info(
+                            "💡 Zoom URL may be invalid or expired. Please check:\n"
+                            "   - URL format: https://zoom.us/j/... or https://us05web.zoom.us/j/...\n"
+                            "   - Meeting is not expired or cancelled\n"
+                            "   - Meeting allows participants to join"
+                        )
                     elif "authentication" in error_msg.lower() or "credentials" in error_msg.lower():
-                        print(f"💡 Zoom authentication issue. The bot needs:")
-                        print(f"   - Valid Zoom meeting link")
-                        print(f"   - Meeting host to allow bot to join")
-                        print(f"   - No waiting room or pre-approval required")
+                        log.info(
+                            "💡 Zoom authentication issue. The bot needs:\n"
+                            "   - Valid Zoom meeting link\n"
+                            "   - Meeting host to allow bot to join\n"
+                            "   - No waiting room or pre-approval required"
+                        )
         
         # Create tracking document in MongoDB
-        # Store ONLY: notetaker_id (as _id), status, transcript_text (empty initially)
+        # Store: notetaker_id (as _id), event_id, status, created_at (the transcript is added when ready)
         if notetaker_id:
             await transcript_collection.insert_one({
                 "_id": notetaker_id,
-                "status": "scheduled"
+                "event_id": event_id,
+                "status": "scheduled",
+                "created_at": datetime.now(timezone.utc)
             })
             # Start a background task to poll for the transcript after the meeting
-            background_tasks.add_task(check_and_get_transcript, notetaker_id)
-            print(f"✅ Meeting scheduled: {request.title} at {start_dt.strftime('%Y-%m-%d %I:%M %p IST')}")
-            print(f"✅ Bot will join automatically. Notetaker ID: {notetaker_id}")
+            _start_transcript_task(notetaker_id)
+            log.info("✅ Meeting scheduled: %s at %s", request.title, f"{start_dt:%Y-%m-%d %I:%M %p} IST")
+            log.info("✅ Bot will join automatically. Notetaker ID: %s", notetaker_id)
         else:
-            print(f"⚠️ Meeting created but bot deployment failed")
+            log.warning("⚠️ Meeting created but bot deployment failed")
         
         # Generate Google Calendar link
         calendar_link = f"https://calendar.google.com/calendar/event?eid={event_id}" if event_id else None
         
-        return {
-            "success": True,
-            "message": f"✅ Meeting scheduled successfully{' with ' + provider + ' as conferencing provider' if provider and 'fallback' not in provider else ' with conferencing link' if not provider else ' with ' + provider}! Event added to Google Calendar and bot configured to join automatically.",
-            "event_id": event_id,
-            "title": request.title,
-            "start_time": start_dt.strftime("%Y-%m-%d %I:%M %p IST"),
-            "meeting_link": request.meeting_link,
-            "provider": provider.replace(" (fallback)", "") if provider else "Generic",
-            "calendar_link": calendar_link,
-            "notetaker_id": notetaker_id,
-            "bot_status": "Configured to join at scheduled time" if notetaker_id else f"Failed to configure bot: {bot_error}" if bot_error else "Failed to configure bot",
-            "next_steps": [
-                "✅ Event has been added to your Google Calendar",
-                "✅ Bot will automatically join the meeting at the scheduled time" if notetaker_id else f"❌ Bot failed to configure: {bot_error}" if bot_error else "❌ Bot failed to configure",
-                f"✅ After the meeting, use Notetaker ID '{notetaker_id}' to check the transcript" if notetaker_id else "❌ No transcript will be available due to bot failure"
-            ]
-        }
+        return ORJSONResponse(_build_schedule_response(
+            request, start_dt, event_id, provider, calendar_link, notetaker_id, bot_error
+        ))
         
     except NylasApiError as e:
         raise HTTPException(
@@ -542,8 +811,8 @@ async def schedule_meeting(request: ScheduleMeetingRequest, background_tasks: Ba
 # --- FETCH CALENDAR EVENTS AND AUTO-DEPLOY BOT ---
 
 class FetchEventsRequest(BaseModel):
-    start_date: str  # Format: "2025-10-07" (IST)
-    end_date: Optional[str] = None  # Optional end date
+    start_date: date  # Format: "2025-10-07" (IST)
+    end_date: Optional[date] = None  # Optional end date
     calendar_id: Optional[str] = "primary"
 
 
@@ -570,27 +839,17 @@ async def fetch_calendar_events(request: FetchEventsRequest):
         raise HTTPException(status_code=500, detail="Nylas client not initialized.")
     
     try:
-        from datetime import datetime
-        import pytz
-        
-        # Set timezone to IST
-        ist_tz = pytz.timezone("Asia/Kolkata")
-        
-        # Parse start date
-        start_dt = datetime.strptime(request.start_date, "%Y-%m-%d")
-        start_dt = ist_tz.localize(start_dt.replace(hour=0, minute=0, second=0))
+        # Dates are parsed by the request model; expand them to whole IST days
+        start_dt = datetime.combine(request.start_date, time.min, tzinfo=IST)
         start_timestamp = int(start_dt.timestamp())
         
-        # Parse end date (default to end of start date)
-        if request.end_date:
-            end_dt = datetime.strptime(request.end_date, "%Y-%m-%d")
-            end_dt = ist_tz.localize(end_dt.replace(hour=23, minute=59, second=59))
-        else:
-            end_dt = start_dt.replace(hour=23, minute=59, second=59)
+        # End date defaults to the end of the start date
+        end_dt = datetime.combine(request.end_date or request.start_date, time(23, 59, 59), tzinfo=IST)
         end_timestamp = int(end_dt.timestamp())
         
         # Fetch events from Nylas
-        events_response = client.events.list(
+        events_response = await call_nylas(
+            client.events.list,
             identifier=NYLAS_GRANT_ID,
             query_params={
                 "calendar_id": request.calendar_id,
@@ -604,61 +863,49 @@ async def fetch_calendar_events(request: FetchEventsRequest):
         for event in events_response.data:
             event_info = {
                 "event_id": event.id,
-                "title": event.title if hasattr(event, 'title') else "Untitled",
+                "title": getattr(event, "title", "Untitled"),
                 "start_time": None,
                 "end_time": None,
                 "meeting_link": None,
                 "conferencing_provider": None,
-                "status": event.status if hasattr(event, 'status') else "unknown"
+                "status": getattr(event, "status", "unknown")
             }
             
             # Extract time information
-            if hasattr(event, 'when') and event.when:
-                if hasattr(event.when, 'start_time'):
-                    start_ts = event.when.start_time
-                    start_dt_obj = datetime.fromtimestamp(start_ts, tz=ist_tz)
-                    event_info["start_time"] = start_dt_obj.strftime("%Y-%m-%d %I:%M %p IST")
+            when = getattr(event, "when", None)
+            if when:
+                start_ts = getattr(when, "start_time", None)
+                if start_ts is not None:
+                    event_info["start_time"] = _fmt_ist(start_ts)
                 
-                if hasattr(event.when, 'end_time'):
-                    end_ts = event.when.end_time
-                    end_dt_obj = datetime.fromtimestamp(end_ts, tz=ist_tz)
-                    event_info["end_time"] = end_dt_obj.strftime("%Y-%m-%d %I:%M %p IST")
+                end_ts = getattr(when, "end_time", None)
+                if end_ts is not None:
+                    event_info["end_time"] = _fmt_ist(end_ts)
             
             # Extract meeting link from conferencing details
-            if hasattr(event, 'conferencing') and event.conferencing:
-                if hasattr(event.conferencing, 'provider'):
-                    event_info["conferencing_provider"] = event.conferencing.provider
-                
-                if hasattr(event.conferencing, 'details') and event.conferencing.details:
-                    if hasattr(event.conferencing.details, 'url'):
-                        event_info["meeting_link"] = event.conferencing.details.url
+            conf = getattr(event, "conferencing", None)
+            if conf:
+                event_info["conferencing_provider"] = getattr(conf, "provider", None)
+                details = getattr(conf, "details", None)
+                if details:
+                    event_info["meeting_link"] = getattr(details, "url", None)
             
             events_list.append(event_info)
         
         return {
             "total_events": len(events_list),
             "date_range": {
-                "start": start_dt.strftime("%Y-%m-%d %I:%M %p IST"),
-                "end": end_dt.strftime("%Y-%m-%d %I:%M %p IST")
+                "start": f"{start_dt:%Y-%m-%d %I:%M %p} IST",
+                "end": f"{end_dt:%Y-%m-%d %I:%M %p} IST"
             },
             "events": events_list
         }
         
-    except ValueError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid date format. Use 'YYYY-MM-DD'. Error: {str(e)}"
-        )
     except NylasApiError as e:
         raise HTTPException(
             status_code=400,
             detail=f"Failed to fetch calendar events: {str(e)}"
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Unexpected error: {str(e)}"
-        )
 
 
 class AutoDeployBotRequest(BaseModel):
@@ -667,7 +914,7 @@ class AutoDeployBotRequest(BaseModel):
 
 
 @app.post("/auto-deploy-bot")
-async def auto_deploy_bot_to_event(request: AutoDeployBotRequest, background_tasks: BackgroundTasks):
+async def auto_deploy_bot_to_event(request: AutoDeployBotRequest):
     """
     🤖 AUTO-DEPLOY BOT: Automatically deploy notetaker bot to an existing calendar event.
     
@@ -691,7 +938,8 @@ async def auto_deploy_bot_to_event(request: AutoDeployBotRequest, background_tas
     
     try:
         # 1. Fetch the specific calendar event
-        event = client.events.find(
+        event = await call_nylas(
+            client.events.find,
             identifier=NYLAS_GRANT_ID,
             event_id=request.event_id,
             query_params={"calendar_id": request.calendar_id}
@@ -700,11 +948,9 @@ async def auto_deploy_bot_to_event(request: AutoDeployBotRequest, background_tas
         event_data = event.data
         
         # 2. Extract meeting link from conferencing details
-        meeting_link = None
-        if hasattr(event_data, 'conferencing') and event_data.conferencing:
-            if hasattr(event_data.conferencing, 'details') and event_data.conferencing.details:
-                if hasattr(event_data.conferencing.details, 'url'):
-                    meeting_link = event_data.conferencing.details.url
+        conf = getattr(event_data, "conferencing", None)
+        details = getattr(conf, "details", None) if conf else None
+        meeting_link = getattr(details, "url", None) if details else None
         
         if not meeting_link:
             raise HTTPException(
@@ -723,27 +969,31 @@ async def auto_deploy_bot_to_event(request: AutoDeployBotRequest, background_tas
             },
         }
         
-        notetaker_response = client.notetakers.invite(
+        notetaker_response = await call_nylas(
+            client.notetakers.invite,
             identifier=NYLAS_GRANT_ID,
             request_body=request_body
         )
         
         notetaker_id = notetaker_response.data.id
         
-        # 4. Create tracking document in MongoDB (ONLY 3 fields)
+        # 4. Create tracking document in MongoDB
+        # event_id lets delete_calendar_event find (via its index) and remove this document
         await transcript_collection.insert_one({
             "_id": notetaker_id,
-            "status": "processing"
+            "event_id": request.event_id,
+            "status": "processing",
+            "created_at": datetime.now(timezone.utc)
         })
         
         # 5. Start background task to check for transcript
-        background_tasks.add_task(check_and_get_transcript, notetaker_id)
+        _start_transcript_task(notetaker_id)
         
         return {
             "message": "Bot successfully deployed to the meeting!",
             "notetaker_id": notetaker_id,
             "event_id": request.event_id,
-            "event_title": event_data.title if hasattr(event_data, 'title') else "Untitled",
+            "event_title": getattr(event_data, "title", "Untitled"),
             "meeting_link": meeting_link,
             "status": "Bot will join the meeting and start recording"
         }
@@ -753,10 +1003,11 @@ async def auto_deploy_bot_to_event(request: AutoDeployBotRequest, background_tas
             status_code=400,
             detail=f"Failed to deploy bot: {str(e)}"
         )
-    except Exception as e:
+    except PyMongoError:
+        log.exception("Tracking deployed bot for event %s failed", request.event_id)
         raise HTTPException(
             status_code=500,
-            detail=f"Unexpected error: {str(e)}"
+            detail="Bot was deployed but could not be tracked in the database."
         )
 
 
@@ -766,7 +1017,7 @@ class DeleteEventRequest(BaseModel):
 
 
 @app.delete("/calendar-events/{event_id}")
-async def delete_calendar_event(event_id: str, calendar_id: str = "primary"):
+async def delete_calendar_event(event_id: str, calendar_id: str = "primary", verify: bool = False):
     """
     🗑️ DELETE CALENDAR EVENT: Delete a calendar event from Google Calendar.
     
@@ -778,92 +1029,89 @@ async def delete_calendar_event(event_id: str, calendar_id: str = "primary"):
     Args:
         event_id: The ID of the calendar event to delete
         calendar_id: Optional calendar ID (defaults to "primary")
+        verify: Look up the event first so the response includes its title (one extra Nylas call)
     
     Returns:
         Confirmation message
     
     Note: This action cannot be undone! The event will be removed from your calendar.
     """
-    print(f"\n{'='*60}")
-    print(f"🗑️ DELETE REQUEST RECEIVED")
-    print(f"Event ID: {event_id}")
-    print(f"Calendar ID: {calendar_id}")
-    print(f"{'='*60}\n")
+    log.info("🗑️ DELETE REQUEST RECEIVED - Event ID: %s, Calendar ID: %s", event_id, calendar_id)
     
     if not client:
         raise HTTPException(status_code=500, detail="Nylas client not initialized.")
     
     try:
-        print(f"🗑️ Attempting to delete event: {event_id} from calendar: {calendar_id}")
+        log.info("🗑️ Attempting to delete event: %s from calendar: %s", event_id, calendar_id)
         
-        # First, try to get the event to verify it exists
+        # Optionally look up the event title first (costs an extra Nylas round-trip)
         event_title = "Unknown"
-        event_exists = False
+        if verify:
+            try:
+                event = await call_nylas(
+                    client.events.find,
+                    identifier=NYLAS_GRANT_ID,
+                    event_id=event_id,
+                    query_params={"calendar_id": calendar_id}
+                )
+                event_title = getattr(event.data, 'title', None) or "Untitled"
+                log.info("✅ Found event: %s", event_title)
+            except NylasApiError as find_error:
+                log.warning("⚠️ Event not found in Nylas: %s", find_error)
+                # Event might not exist in Nylas but could exist in MongoDB
+                # Continue to try deletion and cleanup
+            except Exception as find_e:
+                log.warning("⚠️ Error finding event: %s", find_e)
         
-        try:
-            event = client.events.find(
+        # Delete the event from the calendar and clean up associated recording/tracking
+        # in MongoDB concurrently. The cleanup matters even if the calendar event doesn't exist.
+        # Note: Nylas destroy() returns an empty response (204 No Content)
+        # This is normal and expected behavior
+        destroy_result, cleanup_result = await asyncio.gather(
+            call_nylas(
+                client.events.destroy,
                 identifier=NYLAS_GRANT_ID,
                 event_id=event_id,
                 query_params={"calendar_id": calendar_id}
-            )
-            event_title = event.data.title if hasattr(event.data, 'title') else "Untitled"
-            event_exists = True
-            print(f"✅ Found event: {event_title}")
-        except NylasApiError as find_error:
-            print(f"⚠️ Event not found in Nylas: {find_error}")
-            # Event might not exist in Nylas but could exist in MongoDB
-            # Continue to try deletion and cleanup
-        except Exception as find_e:
-            print(f"⚠️ Error finding event: {find_e}")
-        
-        # Try to delete the event from calendar
+            ),
+            _delete_event_recordings(event_id),
+            return_exceptions=True,
+        )
+        
         deletion_success = False
         deletion_error = None
-        try:
-            if event_exists:
-                # Note: Nylas destroy() returns an empty response (204 No Content)
-                # This is normal and expected behavior
-                client.events.destroy(
-                    identifier=NYLAS_GRANT_ID,
-                    event_id=event_id,
-                    query_params={"calendar_id": calendar_id}
-                )
-                # If no exception was raised, deletion was successful
-                deletion_success = True
-                print(f"✅ Event deleted from Google Calendar")
-            else:
-                print(f"⚠️ Event not found in Nylas, skipping calendar deletion")
-        except NylasApiError as delete_error:
-            error_msg = str(delete_error)
-            print(f"❌ Nylas delete error: {error_msg}")
+        if isinstance(destroy_result, NylasApiError):
+            error_msg = str(destroy_result)
+            log.error("❌ Nylas delete error: %s", error_msg)
             deletion_error = error_msg
             # If it's a "not found" error, it might already be deleted
-            if "not found" in error_msg.lower() or "404" in error_msg:
-                print("ℹ️ Event may have been already deleted from calendar")
+            if _is_not_found(destroy_result):
+                log.info("ℹ️ Event may have been already deleted from calendar")
                 # Don't raise, continue to cleanup
             else:
                 # For other errors, we'll still try to cleanup but record the error
-                print(f"⚠️ Calendar deletion failed but will continue with cleanup")
-        except Exception as delete_e:
+                log.warning("⚠️ Calendar deletion failed but will continue with cleanup")
+        elif isinstance(destroy_result, BaseException):
             # Ignore JSON parsing errors from empty responses (expected for delete)
-            if "Expecting value" not in str(delete_e):
-                deletion_error = str(delete_e)
-                print(f"❌ Unexpected error during calendar deletion: {delete_e}")
+            if "Expecting value" not in str(destroy_result):
+                deletion_error = str(destroy_result)
+                log.error("❌ Unexpected error during calendar deletion: %s", destroy_result)
             else:
                 # Empty response is actually success for delete operations
                 deletion_success = True
-                print(f"✅ Event deleted from Google Calendar (empty response is normal)")
+                log.info("✅ Event deleted from Google Calendar (empty response is normal)")
+        else:
+            # If no exception was raised, deletion was successful
+            deletion_success = True
+            log.info("✅ Event deleted from Google Calendar")
         
-        # Always try to clean up associated recording/tracking in MongoDB
-        # This is important even if the calendar event doesn't exist
         recordings_deleted = 0
-        try:
-            result = await transcript_collection.delete_many({"event_id": event_id})
-            recordings_deleted = result.deleted_count
+        if isinstance(cleanup_result, BaseException):
+            log.warning("⚠️ Could not check/delete associated recordings: %s", cleanup_result)
+        else:
+            recordings_deleted = cleanup_result
             if recordings_deleted > 0:
-                print(f"✅ Deleted {recordings_deleted} associated recording(s) for event {event_id}")
-        except Exception as e:
-            print(f"⚠️ Could not check/delete associated recordings: {e}")
+                log.info("✅ Deleted %s associated recording(s) for event %s", recordings_deleted, event_id)
         
         # Determine success message
         response_data = {
@@ -878,14 +1126,12 @@ async def delete_calendar_event(event_id: str, calendar_id: str = "primary"):
             response_data["message"] = f"Event deleted successfully! {f'Title: {event_title}' if event_title != 'Unknown' else ''}"
             if deletion_error:
                 response_data["warning"] = f"Calendar deletion had issues: {deletion_error}"
-            print(f"\n✅ DELETE SUCCESSFUL - Returning response:")
-            print(f"   Response: {response_data}")
-            print(f"{'='*60}\n")
+            log.info("✅ DELETE SUCCESSFUL")
+            log.debug("   Response: %s", response_data)
             return response_data
         else:
             # Neither calendar event nor recordings found
-            print(f"\n❌ DELETE FAILED - Event not found")
-            print(f"{'='*60}\n")
+            log.warning("❌ DELETE FAILED - Event not found")
             raise HTTPException(
                 status_code=404,
                 detail=f"Event '{event_id}' not found in calendar or database. It may have been already deleted."
@@ -893,14 +1139,12 @@ async def delete_calendar_event(event_id: str, calendar_id: str = "primary"):
         
     except HTTPException as http_exc:
         # Re-raise HTTP exceptions
-        print(f"\n⚠️ HTTP Exception: {http_exc.detail}")
-        print(f"{'='*60}\n")
+        log.warning("⚠️ HTTP Exception: %s", http_exc.detail)
         raise
     except NylasApiError as e:
         error_msg = str(e)
-        print(f"\n❌ Nylas API Error: {error_msg}")
-        print(f"{'='*60}\n")
-        if "not found" in error_msg.lower() or "404" in error_msg:
+        log.error("❌ Nylas API Error: %s", error_msg)
+        if _is_not_found(e):
             raise HTTPException(
                 status_code=404,
                 detail=f"Calendar event not found. It may have been already deleted."
@@ -911,16 +1155,36 @@ async def delete_calendar_event(event_id: str, calendar_id: str = "primary"):
                 detail=f"Failed to delete calendar event: {error_msg}"
             )
     except Exception as e:
-        print(f"\n❌ UNEXPECTED ERROR during deletion: {type(e).__name__}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        print(f"{'='*60}\n")
+        log.exception("❌ UNEXPECTED ERROR during deletion: %s: %s", type(e).__name__, e)
         raise HTTPException(
             status_code=500,
             detail=f"Unexpected error while deleting event: {str(e)}"
         )
 
 
+# Cached grant lookup for /auth-status: (fetched_at, grant). The grant rarely changes,
+# so bursts of status checks share one upstream call.
+_GRANT_TTL = 60  # seconds
+_grant_cache: Optional[tuple[float, object]] = None
+_grant_lock = asyncio.Lock()
+
+
+async def _get_grant():
+    """Fetch the Nylas grant, serving a cached copy for up to _GRANT_TTL seconds."""
+    global _grant_cache
+    async with _grant_lock:
+        if _grant_cache and monotonic() - _grant_cache[0] < _GRANT_TTL:
+            return _grant_cache[1]
+        _grant_cache = None
+        try:
+            grant = await call_nylas(client.auth.grants.find, grant_id=NYLAS_GRANT_ID)
+        except Exception:
+            # Retry once in case of a transient failure
+            grant = await call_nylas(client.auth.grants.find, grant_id=NYLAS_GRANT_ID)
+        _grant_cache = (monotonic(), grant)
+        return grant
+
+
 @app.get("/auth-status")
 async def check_auth_status():
     """
@@ -938,15 +1202,15 @@ async def check_auth_status():
     
     try:
         # Try to fetch account info to verify authentication
-        grant = client.auth.grants.find(grant_id=NYLAS_GRANT_ID)
+        grant = await _get_grant()
         
         return {
             "authenticated": True,
             "message": "Successfully authenticated with Nylas",
             "grant_id": NYLAS_GRANT_ID,
-            "email": grant.data.email if hasattr(grant.data, 'email') else None,
-            "provider": grant.data.provider if hasattr(grant.data, 'provider') else None,
-            "status": grant.data.grant_status if hasattr(grant.data, 'grant_status') else None
+            "email": getattr(grant.data, 'email', None),
+            "provider": getattr(grant.data, 'provider', None),
+            "status": getattr(grant.data, 'grant_status', None)
         }
     except Exception as e:
         return {
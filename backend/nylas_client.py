@@ -1,4 +1,9 @@
+import asyncio
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
 from nylas import Client
 from dotenv import load_dotenv
 
@@ -7,6 +12,8 @@ load_dotenv()
 # --- Configuration ---
 NYLAS_API_KEY = os.environ.get("NYLAS_API_KEY")
 NYLAS_GRANT_ID = os.environ.get("NYLAS_GRANT_ID")
+# Optional: when set, notetaker webhook calls must carry a valid X-Nylas-Signature
+NYLAS_WEBHOOK_SECRET = os.environ.get("NYLAS_WEBHOOK_SECRET")
 
 if not NYLAS_API_KEY or not NYLAS_GRANT_ID:
     raise ValueError(
@@ -17,6 +24,34 @@ if not NYLAS_API_KEY or not NYLAS_GRANT_ID:
 try:
     client = Client(api_key=NYLAS_API_KEY)
 except Exception as e:
-    print(f"Error initializing Nylas client: {e}")
+    logging.getLogger("notetaker").error("Error initializing Nylas client: %s", e)
     # Handle the error appropriately
-    client = None
\ No newline at end of file
+    client = None
+
+# --- Blocking SDK calls ---
+# The Nylas SDK is synchronous; run its calls on a bounded pool so they never block the event loop.
+# The pool is created on app startup (or first use) and shut down with the app, so a new
+# lifespan in the same process gets a fresh pool.
+_nylas_executor: Optional[ThreadPoolExecutor] = None
+
+
+def start_nylas_executor() -> ThreadPoolExecutor:
+    """Create the Nylas thread pool if it isn't running, and return it."""
+    global _nylas_executor
+    if _nylas_executor is None:
+        _nylas_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="nylas")
+    return _nylas_executor
+
+
+def stop_nylas_executor() -> None:
+    """Shut down the Nylas thread pool, cancelling calls that haven't started."""
+    global _nylas_executor
+    if _nylas_executor is not None:
+        _nylas_executor.shutdown(wait=False, cancel_futures=True)
+        _nylas_executor = None
+
+
+async def call_nylas(fn, *args, **kwargs):
+    """Run a blocking Nylas SDK call on the Nylas thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(start_nylas_executor(), partial(fn, *args, **kwargs))
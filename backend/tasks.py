@@ -1,263 +1,335 @@
 import asyncio
+import logging
 import httpx  # Import httpx for making HTTP requests
-import json
+import orjson
+from cachetools import LRUCache
 from nylas.models.notetakers import NotetakerState
-from nylas_client import client, NYLAS_GRANT_ID
-from database import transcript_collection
+from nylas_client import client, call_nylas, NYLAS_GRANT_ID
+from database import encode_transcript, status_collection, transcript_collection
 
-# A simple in-memory store for transcripts (backup)
-transcripts = {}
+log = logging.getLogger("notetaker")
 
+# A simple in-memory store for transcripts (backup), bounded to the most recent ones
+transcripts = LRUCache(maxsize=256)
 
-async def check_and_get_transcript(notetaker_id: str):
+# Poll backoff: start at 5s, double after each quiet check, cap at 2 minutes
+MIN_POLL_DELAY = 5
+MAX_POLL_DELAY = 120
+MAX_WAIT_SECONDS = 60 * 60  # Give up after 1 hour
+
+# In-progress Nylas notetaker states -> status stored in MongoDB
+# (Only 4 valid Nylas states: CONNECTING, ATTENDING, MEDIA_PROCESSING, MEDIA_AVAILABLE)
+_STATE_STATUS = {
+    NotetakerState.CONNECTING: "joining",  # Bot is connecting to the meeting
+    NotetakerState.ATTENDING: "recording",  # Bot is in the meeting (Attending)
+    NotetakerState.MEDIA_PROCESSING: "processing",  # Bot is processing the media after meeting ends
+}
+
+# Appended to the placeholder transcript stored when Nylas returns an empty transcript
+_EMPTY_TRANSCRIPT_REASON = (
+    "Transcript was empty. Possible reasons:\\n"
+    "• Meeting was too short (< 30 seconds)\\n"
+    "• No one spoke during the meeting\\n"
+    "• Transcription service couldn't detect clear audio\\n"
+    "• Meeting platform doesn't support transcription for this type of meeting\\n"
+    "• For Zoom: Ensure transcription is enabled in meeting settings"
+)
+
+
+def _strip_edges(value):
+    """Strip surrounding whitespace, without copying the string when there is none (the usual case)."""
+    if value and (value[0].isspace() or value[-1].isspace()):
+        return value.strip()
+    return value
+
+
+# notetaker_id -> Event set by the Nylas webhook to wake the poller early
+_wakeups: dict[str, asyncio.Event] = {}
+
+
+def notify_notetaker_update(notetaker_id: str) -> bool:
+    """
+    Wake the background task monitoring a notetaker (called from the Nylas webhook).
+    Returns True if a task was waiting on this notetaker.
+    """
+    wakeup = _wakeups.get(notetaker_id)
+    if wakeup is None:
+        return False
+    wakeup.set()
+    return True
+
+
+async def _wait_for_update(wakeup: asyncio.Event, delay: float) -> bool:
+    """Sleep for up to `delay` seconds, returning early (True) if a webhook arrives."""
+    try:
+        await asyncio.wait_for(wakeup.wait(), timeout=delay)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        wakeup.clear()
+
+
+async def check_and_get_transcript(notetaker_id: str, http_client: httpx.AsyncClient):
     """
     Checks the status of the notetaker and updates MongoDB with the transcript text.
+    Polls with exponential backoff and re-checks immediately when the Nylas webhook
+    reports an update for this notetaker.
     Args:
         notetaker_id: The ID of the notetaker to check.
+        http_client: The app's shared async HTTP client, used to download the transcript file.
     """
-    print(f"🔄 Starting background task to monitor notetaker: {notetaker_id}")
-    max_retries = 120  # Poll for up to 1 hour (120 * 30 seconds)
+    wakeup = _wakeups.setdefault(notetaker_id, asyncio.Event())
+    try:
+        await _monitor_notetaker(notetaker_id, wakeup, http_client)
+    finally:
+        _wakeups.pop(notetaker_id, None)
+
+
+async def _monitor_notetaker(notetaker_id: str, wakeup: asyncio.Event, http_client: httpx.AsyncClient):
+    log.info("🔄 Starting background task to monitor notetaker: %s", notetaker_id)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + MAX_WAIT_SECONDS
+    delay = MIN_POLL_DELAY
     retry_count = 0
+    finished = False
+    last_status = None
 
-    # Use an async HTTP client for fetching the transcript file
-    async with httpx.AsyncClient() as http_client:
-        while retry_count < max_retries:
-            retry_count += 1
-            try:
-                notetaker = client.notetakers.find(
+    while loop.time() < deadline:
+        retry_count += 1
+        try:
+            notetaker = await call_nylas(
+                client.notetakers.find,
+                identifier=NYLAS_GRANT_ID, notetaker_id=notetaker_id
+            )
+            current_state = notetaker.data.state
+            log.info("📊 Notetaker state for %s: %s (Check #%s)", notetaker_id, current_state, retry_count)
+            
+            # Update the status in MongoDB based on current state, only when it changed
+            new_status = _STATE_STATUS.get(current_state)
+            if new_status and new_status != last_status:
+                result = await status_collection.update_one(
+                    {"_id": notetaker_id},
+                    {"$set": {"status": new_status}}
+                )
+                if result.matched_count == 0:
+                    log.info("🛑 Tracking document for %s was deleted, stopping monitor", notetaker_id)
+                    return
+                last_status = new_status
+            
+            if current_state == NotetakerState.MEDIA_AVAILABLE:
+                log.info("✅ Media available for %s! Fetching transcript...", notetaker_id)
+                media = await call_nylas(
+                    client.notetakers.get_media,
                     identifier=NYLAS_GRANT_ID, notetaker_id=notetaker_id
                 )
-                current_state = notetaker.data.state
-                print(f"📊 Notetaker state for {notetaker_id}: {current_state} (Check #{retry_count})")
                 
-                # Update the status in MongoDB based on current state
-                # Only 4 valid Nylas states: CONNECTING, ATTENDING, MEDIA_PROCESSING, MEDIA_AVAILABLE
-                if current_state == NotetakerState.CONNECTING:
-                    # Bot is connecting to the meeting
-                    await transcript_collection.update_one(
-                        {"_id": notetaker_id},
-                        {"$set": {"status": "joining"}}
-                    )
-                elif current_state == NotetakerState.ATTENDING:
-                    # Bot is in the meeting (Attending)
-                    await transcript_collection.update_one(
-                        {"_id": notetaker_id},
-                        {"$set": {"status": "recording"}}
-                    )
-                elif current_state == NotetakerState.MEDIA_PROCESSING:
-                    # Bot is processing the media after meeting ends
-                    await transcript_collection.update_one(
-                        {"_id": notetaker_id},
-                        {"$set": {"status": "processing"}}
-                    )
-                
-                if current_state == NotetakerState.MEDIA_AVAILABLE:
-                    print(f"✅ Media available for {notetaker_id}! Fetching transcript...")
-                    media = client.notetakers.get_media(
-                        identifier=NYLAS_GRANT_ID, notetaker_id=notetaker_id
-                    )
-                    
-                    # Debug: Print media structure to understand what's available
-                    print(f"📊 Media object type: {type(media)}")
-                    print(f"📊 Media data type: {type(media.data)}")
+                # Debug: Print media structure to understand what's available
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("📊 Media object type: %s", type(media))
+                    log.debug("📊 Media data type: %s", type(media.data))
                     if hasattr(media.data, '__dict__'):
-                        print(f"📊 Media data attributes: {media.data.__dict__.keys()}")
-                    
-                    transcript_data = None
-                    transcript_text_combined = ""
-                    
-                    # Check if transcript exists and has URL
-                    if hasattr(media.data, 'transcript') and media.data.transcript:
-                        if hasattr(media.data.transcript, 'url') and media.data.transcript.url:
-                            transcript_url = media.data.transcript.url
+                        log.debug("📊 Media data attributes: %s", media.data.__dict__.keys())
+                
+                transcript_data = None
+                transcript_text_combined = ""
+                
+                # Check if transcript exists and has URL
+                transcript = getattr(media.data, 'transcript', None)
+                if transcript:
+                    transcript_url = getattr(transcript, 'url', None)
+                    if transcript_url:
+                        
+                        # 1. Fetch the content from the URL
+                        log.info("📥 Fetching transcript from URL: %s", transcript_url)
+                        log.debug("🔗 URL host: %s", transcript_url.split('/')[2] if len(transcript_url.split('/')) > 2 else 'unknown')
+                        try:
+                            async with http_client.stream("GET", transcript_url, timeout=60) as response:
+                                response.raise_for_status()  # Raise an exception for bad status codes
+                                content = await response.aread()
+                            
+                            log.debug("📄 Received response with status: %s", response.status_code)
+                            log.debug("📄 Response content length: %s bytes", len(content))
                             
-                            # 1. Fetch the content from the URL
-                            print(f"📥 Fetching transcript from URL: {transcript_url}")
-                            print(f"🔗 URL host: {transcript_url.split('/')[2] if len(transcript_url.split('/')) > 2 else 'unknown'}")
+                            # Parse the raw bytes as JSON (no intermediate str decode)
                             try:
-                                response = await http_client.get(transcript_url, timeout=60)
-                                response.raise_for_status()  # Raise an exception for bad status codes
+                                raw_transcript = orjson.loads(content)
+                                log.debug("📄 Parsed JSON successfully. Type: %s", type(raw_transcript))
                                 
-                                print(f"📄 Received response with status: {response.status_code}")
-                                print(f"📄 Response content length: {len(response.text)} characters")
+                                # Handle Nylas transcript structure: {"object": "transcript", "type": "...", "transcript": [...]}
+                                if isinstance(raw_transcript, dict) and 'transcript' in raw_transcript:
+                                    transcript_array = raw_transcript['transcript']
+                                    log.debug("📄 Found transcript array in wrapper object with %s entries", len(transcript_array))
+                                elif isinstance(raw_transcript, list):
+                                    transcript_array = raw_transcript
+                                    log.debug("📄 Transcript is direct array with %s entries", len(transcript_array))
+                                else:
+                                    transcript_array = [raw_transcript]
+                                    log.debug("📄 Transcript is single object, wrapped in array")
                                 
-                                # Parse the response as JSON
-                                try:
-                                    raw_transcript = json.loads(response.text)
-                                    print(f"📄 Parsed JSON successfully. Type: {type(raw_transcript)}")
-                                    print(f"📄 Full transcript JSON: {json.dumps(raw_transcript, indent=2)}")
-                                    
-                                    # Handle Nylas transcript structure: {"object": "transcript", "type": "...", "transcript": [...]}
-                                    if isinstance(raw_transcript, dict) and 'transcript' in raw_transcript:
-                                        transcript_array = raw_transcript['transcript']
-                                        print(f"📄 Found transcript array in wrapper object with {len(transcript_array)} entries")
-                                    elif isinstance(raw_transcript, list):
-                                        transcript_array = raw_transcript
-                                        print(f"📄 Transcript is direct array with {len(transcript_array)} entries")
-                                    else:
-                                        transcript_array = [raw_transcript]
-                                        print(f"📄 Transcript is single object, wrapped in array")
-                                    
-                                    # Extract text AND speaker, store as clean JSON array
-                                    clean_transcript_array = []
-                                    unique_speakers = set()
-                                    for entry in transcript_array:
-                                        if isinstance(entry, dict):
-                                            # Direct structure: {"speaker": "...", "text": "...", "start": ..., "end": ...}
-                                            segment_text = entry.get('text', '').strip()
-                                            segment_speaker = entry.get('speaker', 'Speaker').strip()
-                                            
-                                            if segment_text:
-                                                unique_speakers.add(segment_speaker)
-                                                transcript_entry = {
-                                                    "speaker": segment_speaker,
-                                                    "text": segment_text
-                                                }
-                                                
-                                                clean_transcript_array.append(transcript_entry)
-                                                print(f"📝 Added transcript entry: {segment_speaker}: {segment_text[:50]}...")
-                                            else:
-                                                print(f"⚠️ Skipping empty text entry from speaker: {segment_speaker}")
-                                        elif isinstance(entry, str):
-                                            clean_transcript_array.append({
-                                                "speaker": "Speaker",
-                                                "text": entry.strip()
-                                            })
-                                            print(f"📝 Added string transcript entry: {entry[:50]}...")
-                                    
-                                    print(f"🎤 Detected speakers: {list(unique_speakers)}")
-                                    
-                                    # Store as JSON array (will be stored as array in MongoDB)
-                                    if clean_transcript_array:
-                                        transcript_data = clean_transcript_array
-                                        print(f"✅ Successfully parsed transcript with {len(transcript_data)} entries for {notetaker_id}")
-                                        # Log first entry for verification
-                                        if len(transcript_data) > 0:
-                                            first_entry = transcript_data[0]
-                                            print(f"📝 First transcript entry sample: {first_entry}")
-                                    else:
-                                        print(f"⚠️ No valid transcript entries found after parsing")
-                                        print(f"⚠️ Raw transcript array had {len(transcript_array)} items")
-                                        print(f"⚠️ Sample of raw array: {transcript_array[:2] if len(transcript_array) > 0 else 'empty'}")
-                                        
-                                        # Provide helpful message about why transcript might be empty
-                                        empty_reason = "Transcript was empty. Possible reasons:\\n"
-                                        empty_reason += "• Meeting was too short (< 30 seconds)\\n"
-                                        empty_reason += "• No one spoke during the meeting\\n"
-                                        empty_reason += "• Transcription service couldn't detect clear audio\\n"
-                                        empty_reason += "• Meeting platform doesn't support transcription for this type of meeting\\n"
-                                        empty_reason += f"• For Zoom: Ensure transcription is enabled in meeting settings"
-                                        
-                                        transcript_data = [{
-                                            "speaker": "System", 
-                                            "text": f"Meeting recorded (ID: {notetaker_id}) but no transcript content available. {empty_reason}"
-                                        }]
-                                        print(f"💾 Storing informative message about empty transcript")
+                                # Extract text AND speaker, store as clean JSON array
+                                clean_transcript_array = []
+                                for entry in transcript_array:
+                                    if isinstance(entry, dict):
+                                        # Direct structure: {"speaker": "...", "text": "...", "start": ..., "end": ...}
+                                        segment_text = _strip_edges(entry.get('text') or '')
+                                        segment_speaker = _strip_edges(entry.get('speaker') or 'Speaker')
                                         
-                                except json.JSONDecodeError as json_err:
-                                    # If not valid JSON, store as plain text in array format
-                                    transcript_data = [{"speaker": "Transcript", "text": response.text}]
-                                    print(f"⚠️ JSON decode error: {json_err}. Stored response as plain text transcript for {notetaker_id}")
+                                        if segment_text:
+                                            transcript_entry = {
+                                                "speaker": segment_speaker,
+                                                "text": segment_text
+                                            }
+                                            
+                                            clean_transcript_array.append(transcript_entry)
+                                            log.debug("📝 Added transcript entry: %s: %s...", segment_speaker, segment_text[:50])
+                                        else:
+                                            log.debug("⚠️ Skipping empty text entry from speaker: %s", segment_speaker)
+                                    elif isinstance(entry, str):
+                                        clean_transcript_array.append({
+                                            "speaker": "Speaker",
+                                            "text": _strip_edges(entry)
+                                        })
+                                        log.debug("📝 Added string transcript entry: %s...", entry[:50])
                                 
-                            except httpx.HTTPStatusError as http_e:
-                                status_code = http_e.response.status_code if hasattr(http_e, 'response') else 'Unknown'
-                                print(f"❌ HTTP error fetching transcript: {http_e}")
-                                print(f"❌ Response status: {status_code}")
+                                if log.isEnabledFor(logging.DEBUG):
+                                    log.debug("🎤 Detected speakers: %s", list({e['speaker'] for e in clean_transcript_array}))
                                 
-                                # Provide specific guidance for common errors
-                                if status_code == 401:
-                                    print(f"❌ Authentication failed - check Nylas API key")
-                                elif status_code == 403:
-                                    print(f"❌ Access forbidden - check permissions for notetaker {notetaker_id}")
-                                elif status_code == 404:
-                                    print(f"❌ Transcript not found - may not be ready yet")
-                                elif status_code == 429:
-                                    print(f"❌ Rate limited - too many requests")
+                                # Store as JSON array (will be stored as array in MongoDB)
+                                if clean_transcript_array:
+                                    transcript_data = clean_transcript_array
+                                    log.info("✅ Successfully parsed transcript with %s entries for %s", len(transcript_data), notetaker_id)
+                                    # Log first entry for verification
+                                    if len(transcript_data) > 0:
+                                        first_entry = transcript_data[0]
+                                        log.debug("📝 First transcript entry sample: %s", first_entry)
                                 else:
-                                    print(f"❌ HTTP error {status_code} - check Nylas API documentation")
+                                    log.warning("⚠️ No valid transcript entries found after parsing")
+                                    log.debug("⚠️ Raw transcript array had %s items", len(transcript_array))
+                                    log.debug("⚠️ Sample of raw array: %s", transcript_array[:2] if len(transcript_array) > 0 else 'empty')
+                                    
+                                    # Provide helpful message about why transcript might be empty
+                                    transcript_data = [{
+                                        "speaker": "System", 
+                                        "text": f"Meeting recorded (ID: {notetaker_id}) but no transcript content available. {_EMPTY_TRANSCRIPT_REASON}"
+                                    }]
+                                    log.info("💾 Storing informative message about empty transcript")
                                     
-                            except httpx.TimeoutException as timeout_e:
-                                print(f"❌ Timeout error fetching transcript: {timeout_e}")
-                                print(f"❌ Transcript URL may be slow or unresponsive")
-                            except httpx.RequestError as req_e:
-                                print(f"❌ Request error fetching transcript: {req_e}")
-                                print(f"❌ Check network connectivity or Nylas API status")
-                            except Exception as fetch_e:
-                                print(f"❌ Unexpected error fetching transcript: {fetch_e}")
-                                import traceback
-                                traceback.print_exc()
-                        else:
-                            print(f"⚠️ Transcript object exists but no URL found")
+                            except orjson.JSONDecodeError as json_err:
+                                # If not valid JSON, store as plain text in array format
+                                transcript_data = [{"speaker": "Transcript", "text": content.decode("utf-8", errors="replace")}]
+                                log.warning("⚠️ JSON decode error: %s. Stored response as plain text transcript for %s", json_err, notetaker_id)
+                            
+                        except httpx.HTTPStatusError as http_e:
+                            status_code = http_e.response.status_code if hasattr(http_e, 'response') else 'Unknown'
+                            log.error("❌ HTTP error fetching transcript: %s", http_e)
+                            log.error("❌ Response status: %s", status_code)
+                            
+                            # Provide specific guidance for common errors
+                            if status_code == 401:
+                                log.error("❌ Authentication failed - check Nylas API key")
+                            elif status_code == 403:
+                                log.error("❌ Access forbidden - check permissions for notetaker %s", notetaker_id)
+                            elif status_code == 404:
+                                log.error("❌ Transcript not found - may not be ready yet")
+                            elif status_code == 429:
+                                log.error("❌ Rate limited - too many requests")
+                            else:
+                                log.error("❌ HTTP error %s - check Nylas API documentation", status_code)
+                                
+                        except httpx.TimeoutException as timeout_e:
+                            log.error("❌ Timeout error fetching transcript: %s", timeout_e)
+                            log.error("❌ Transcript URL may be slow or unresponsive")
+                        except httpx.RequestError as req_e:
+                            log.error("❌ Request error fetching transcript: %s", req_e)
+                            log.error("❌ Check network connectivity or Nylas API status")
+                        except Exception as fetch_e:
+                            log.exception("❌ Unexpected error fetching transcript: %s", fetch_e)
                     else:
-                        print(f"⚠️ No transcript object found in media data")
-                        print(f"📋 Available media attributes: {[attr for attr in dir(media.data) if not attr.startswith('_')]}")
-                        if hasattr(media.data, 'transcript'):
-                            print(f"📋 Transcript value: {media.data.transcript}")
-                        
-                        # Try to extract any available text from other media fields
-                        alternative_text = None
-                        if hasattr(media.data, 'summary') and media.data.summary:
-                            alternative_text = f"Meeting Summary: {media.data.summary}"
-                            print(f"📝 Found alternative summary text")
-                        elif hasattr(media.data, 'title') and media.data.title:
-                            alternative_text = f"Meeting Title: {media.data.title}"
-                            print(f"📝 Found alternative title text")
-                        
-                        if alternative_text:
-                            transcript_data = [{"speaker": "System", "text": alternative_text}]
-                            print(f"💾 Using alternative text as transcript for {notetaker_id}")
-                        else:
-                            print(f"❌ No alternative text available")
-                            # Final fallback: save basic meeting info
-                            transcript_data = [{"speaker": "System", "text": f"Meeting recorded but transcript unavailable. Meeting ID: {notetaker_id}"}]
-                            print(f"💾 Saving basic meeting info as fallback for {notetaker_id}")
-
-                    if transcript_data is not None:
-                        # 2. Update the MongoDB document with the transcript (store as JSON array)
-                        await transcript_collection.update_one(
-                            {"_id": notetaker_id},
-                            {
-                                "$set": {
-                                    "status": "ready",
-                                    "transcript_text": transcript_data,  # Store as JSON array [{'speaker': '...', 'text': '...'}]
-                                }
-                            },
-                        )
-                        # Also store in memory for backward compatibility (as combined text)
-                        combined_text = "\n\n".join([item.get('text', '') for item in transcript_data if item.get('text')])
-                        transcripts[notetaker_id] = combined_text
-                        print(f"💾 Transcript ready for {notetaker_id}. Stored {len(transcript_data)} entries in DB.")
+                        log.warning("⚠️ Transcript object exists but no URL found")
+                else:
+                    log.warning("⚠️ No transcript object found in media data")
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("📋 Available media attributes: %s", [attr for attr in dir(media.data) if not attr.startswith('_')])
+                        log.debug("📋 Transcript value: %s", transcript)
+                    
+                    # Try to extract any available text from other media fields
+                    alternative_text = None
+                    summary = getattr(media.data, 'summary', None)
+                    title = getattr(media.data, 'title', None)
+                    if summary:
+                        alternative_text = f"Meeting Summary: {summary}"
+                        log.info("📝 Found alternative summary text")
+                    elif title:
+                        alternative_text = f"Meeting Title: {title}"
+                        log.info("📝 Found alternative title text")
+                    
+                    if alternative_text:
+                        transcript_data = [{"speaker": "System", "text": alternative_text}]
+                        log.info("💾 Using alternative text as transcript for %s", notetaker_id)
                     else:
-                        # Handle cases where media is ready but fetching the text failed
-                        error_reason = "Media available but failed to fetch transcript text - check logs for details"
-                        await transcript_collection.update_one(
-                            {"_id": notetaker_id},
-                            {"$set": {"status": "failed", "reason": error_reason}},
-                        )
-                        print(f"❌ Failed to fetch transcript for {notetaker_id} - no transcript data available")
-                        print(f"💡 Possible causes:")
-                        print(f"   - Transcript URL not accessible")
-                        print(f"   - Invalid JSON format in transcript")
-                        print(f"   - Empty transcript content")
-                        print(f"   - Authentication issues with transcript service")
-                    break
-            except Exception as e:
-                print(f"❌ Error while checking notetaker {notetaker_id}: {e}")
-                # Don't fail immediately, continue polling unless it's a critical error
-                if retry_count >= max_retries:
+                        log.error("❌ No alternative text available")
+                        # Final fallback: save basic meeting info
+                        transcript_data = [{"speaker": "System", "text": f"Meeting recorded but transcript unavailable. Meeting ID: {notetaker_id}"}]
+                        log.info("💾 Saving basic meeting info as fallback for %s", notetaker_id)
+
+                if transcript_data is not None:
+                    # 2. Update the MongoDB document with the transcript (store as JSON array)
+                    result = await transcript_collection.update_one(
+                        {"_id": notetaker_id},
+                        {
+                            "$set": {
+                                "status": "ready",
+                                # Store the JSON array [{'speaker': '...', 'text': '...'}] zstd-compressed
+                                **encode_transcript(transcript_data),
+                            }
+                        },
+                    )
+                    if result.matched_count == 0:
+                        log.info("🛑 Tracking document for %s was deleted, discarding transcript", notetaker_id)
+                        return
+                    # Also store in memory for backward compatibility (as combined text)
+                    combined_text = "\n\n".join(text for text in (item.get('text') for item in transcript_data) if text)
+                    transcripts[notetaker_id] = combined_text
+                    log.info("💾 Transcript ready for %s. Stored %s entries in DB.", notetaker_id, len(transcript_data))
+                else:
+                    # Handle cases where media is ready but fetching the text failed
+                    error_reason = "Media available but failed to fetch transcript text - check logs for details"
                     await transcript_collection.update_one(
                         {"_id": notetaker_id},
-                        {"$set": {"status": "failed", "reason": f"Max retries reached. Last error: {e}"}},
+                        {"$set": {"status": "failed", "reason": error_reason}},
+                    )
+                    log.error("❌ Failed to fetch transcript for %s - no transcript data available", notetaker_id)
+                    log.info(
+                        "💡 Possible causes:\n"
+                        "   - Transcript URL not accessible\n"
+                        "   - Invalid JSON format in transcript\n"
+                        "   - Empty transcript content\n"
+                        "   - Authentication issues with transcript service"
                     )
-                    break
+                finished = True
+                break
+        except Exception as e:
+            log.error("❌ Error while checking notetaker %s: %s", notetaker_id, e)
+            # Don't fail immediately, continue polling unless it's a critical error
+            if loop.time() + delay >= deadline:
+                await transcript_collection.update_one(
+                    {"_id": notetaker_id},
+                    {"$set": {"status": "failed", "reason": f"Max retries reached. Last error: {e}"}},
+                )
+                finished = True
+                break
 
-            # Use asynchronous sleep to avoid blocking
-            await asyncio.sleep(30)
-        
-        # If we exit the loop without finding media
-        if retry_count >= max_retries:
-            print(f"⏱️ Timeout: Notetaker {notetaker_id} did not become ready after {max_retries} checks")
-            await transcript_collection.update_one(
-                {"_id": notetaker_id},
-                {"$set": {"status": "timeout", "reason": "Notetaker did not complete within expected time"}},
-            )
\ No newline at end of file
+        # Wait for a webhook or the next backoff interval, whichever comes first
+        if await _wait_for_update(wakeup, delay):
+            delay = MIN_POLL_DELAY
+        else:
+            delay = min(delay * 2, MAX_POLL_DELAY)
+    
+    # If we exit the loop without finding media
+    if not finished:
+        log.warning("⏱️ Timeout: Notetaker %s did not become ready after %s checks", notetaker_id, retry_count)
+        await transcript_collection.update_one(
+            {"_id": notetaker_id},
+            {"$set": {"status": "timeout", "reason": "Notetaker did not complete within expected time"}},
+        )
\ No newline at end of file
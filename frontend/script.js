@@ -59,6 +59,15 @@ function hideResult(elementId) {
     resultDiv.classList.remove('show');
 }
 
+// Error text from an API error response (validation errors come back as a list)
+function errorDetail(data, fallback) {
+    const detail = data.detail;
+    if (Array.isArray(detail)) {
+        return detail.map(err => (err.msg || '').replace(/^Value error, /, '')).join(' ') || fallback;
+    }
+    return detail || fallback;
+}
+
 // Schedule Meeting Form
 document.getElementById('schedule-form').addEventListener('submit', async (e) => {
     e.preventDefault();
@@ -134,7 +143,7 @@ document.getElementById('schedule-form').addEventListener('submit', async (e) =>
         } else {
             showResult('schedule-result', 'error', `
                 <h3>❌ Error</h3>
-                <p>${data.detail || 'Failed to schedule meeting'}</p>
+                <p>${errorDetail(data, 'Failed to schedule meeting')}</p>
             `);
         }
     } catch (error) {
@@ -537,7 +546,7 @@ document.getElementById('calendar-form').addEventListener('submit', async (e) =>
         } else {
             showResult('calendar-result', 'error', `
                 <h3>❌ Error</h3>
-                <p>${data.detail || 'Failed to fetch calendar events'}</p>
+                <p>${errorDetail(data, 'Failed to fetch calendar events')}</p>
             `);
             document.getElementById('calendar-events-container').innerHTML = '';
         }
@@ -726,7 +735,7 @@ async function deleteCalendarEvent(eventId, eventTitle) {
             showResult('calendar-result', 'success', `
                 <h3>✅ Event Deleted Successfully!</h3>
                 <div class="result-item">
-                    <strong>Event:</strong> ${data.event_title}
+                    <strong>Event:</strong> ${data.event_title && data.event_title !== 'Unknown' ? data.event_title : eventTitle}
                 </div>
                 <div class="result-item">
                     <strong>Event ID:</strong> ${data.deleted_event_id}